@@ -1,7 +1,6 @@
 import logging
 import queue
 import threading
-import time
 from copy import deepcopy
 from typing import Optional
 
@@ -108,25 +107,29 @@ class EnvironController(QtCore.QObject):
             try:
                 with Settings().createResource("environ") as res:
                     while not self._shutdown.is_set():
-                        self.handleRequest(create_driver(res.model)(res))
+                        # Block until next request or next data poll is due
+                        timeout = max(0.025, self.interval - t.delta())
+                        self.handleRequest(create_driver(res.model)(res), timeout)
                         if t.delta() > self.interval:
                             self._queue.put(self._pc_data)
                             t.reset()
             except Exception as exc:
                 self.reset()
                 logger.exception(exc)
-                time.sleep(4.0)
+                self._shutdown.wait(4.0)
 
-    def handleRequest(self, resource) -> None:
+    def handleRequest(self, resource, timeout: float = 0.025) -> None:
         try:
-            request = self._queue.get(timeout=0.025)
+            request = self._queue.get(timeout=timeout)
             self._queue.task_done()
-            logger.debug("environ.dispatch: %s", request)
-            request(resource)
+            if request is not None:
+                logger.debug("environ.dispatch: %s", request)
+                request(resource)
         except queue.Empty:
             ...
 
     def shutdown(self) -> None:
         logger.info("Shutting down environ worker...")
         self._shutdown.set()
+        self._queue.put(None)  # wake up event loop
         self._thread.join()
@@ -51,11 +51,13 @@ class NeedleController(QtCore.QObject):
         except queue.Empty:
             ...
         else:
-            request()
-            request.get()  # raise exceptions
+            if request is not None:
+                request()
+                request.get()  # raise exceptions
 
     def shutdown(self) -> None:
         self._shutdown.set()
+        self._queue.put(None)  # wake up event loop
         self._thread.join()
 
     def requestAbort(self) -> None:
@@ -165,8 +165,8 @@ class TableController(QtCore.QObject):
                 self.enterContext()
             except Exception as exc:
                 logger.exception(exc)
-                time.sleep(1.)
-            time.sleep(.250)  # throttle
+                self._shutdown.wait(1.)
+            self._shutdown.wait(.250)  # throttle
 
     def enterContext(self) -> None:
         try:
@@ -184,11 +184,13 @@ class TableController(QtCore.QObject):
         except queue.Empty:
             ...
         else:
-            request(context)
-            request.get()  # raise exceptions
+            if request is not None:
+                request(context)
+                request.get()  # raise exceptions
 
     def shutdown(self) -> None:
         self._shutdown.set()
+        self._queue.put(None)  # wake up event loop
         self._thread.join()
 
     def requestAbort(self) -> None:
@@ -1,11 +1,12 @@
 import logging
+import queue
 import threading
 import time
-from typing import Callable, Dict
+from typing import Any, Callable, Dict, Generator
 
 import numpy as np
 
-__all__ = ["camera_registry", "Camera", "DummyCamera"]
+__all__ = ["camera_registry", "FrameQueue", "Camera", "DummyCamera"]
 
 camera_registry: Dict[str, Callable] = {}
 
@@ -54,6 +55,41 @@ def exposure_to_multiplier(exposure: float) -> float:
     return multiplier
 
 
+class FrameQueue:
+    """Bounded queue passing frames from a capture thread to a consumer
+    thread, drops the oldest frame if full. Iterating the queue yields frames
+    until the queue was closed.
+    """
+
+    def __init__(self, maxsize: int = 4) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, frame: Any) -> bool:
+        """Enqueue frame, return True if the oldest frame was dropped."""
+        dropped = False
+        while True:
+            try:
+                self._queue.put_nowait(frame)
+                return dropped
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    dropped = True
+                except queue.Empty:
+                    ...
+
+    def close(self) -> None:
+        """Stop iteration of consumer after remaining frames."""
+        self.put(None)
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            yield frame
+
+
 class Camera:
 
     def __init__(self, config: dict) -> None:
@@ -2,7 +2,7 @@ from typing import Iterable
 
 from comet.utils import auto_scale
 
-__all__ = ["format_metric", "format_switch", "format_channels"]
+__all__ = ["format_metric", "LazyMetric", "format_switch", "format_channels"]
 
 
 def format_metric(value: float, unit: str, decimals: int = 3) -> str:
@@ -16,6 +16,24 @@ def format_metric(value: float, unit: str, decimals: int = 3) -> str:
     return f"{value * (1. / scale):.{decimals}f} {prefix}{unit}"
 
 
+class LazyMetric:
+    """Metric value formatted using `format_metric` only when converted to
+    string, e.g. when a log record is actually emitted.
+    >>> str(LazyMetric(.0042, "A"))
+    '4.200 mA'
+    """
+
+    __slots__ = ("value", "unit", "decimals")
+
+    def __init__(self, value: float, unit: str, decimals: int = 3) -> None:
+        self.value: float = value
+        self.unit: str = unit
+        self.decimals: int = decimals
+
+    def __str__(self) -> str:
+        return format_metric(self.value, self.unit, self.decimals)
+
+
 def format_switch(value: bool) -> str:
     """Pretty format for instrument output states.
     >>> format_switch(False)
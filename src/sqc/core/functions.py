@@ -33,21 +33,23 @@ def steady_state_check(callback: Callable, *, n_iterations: int = 7,
     max_std_err: float = 1e-6
     std_err_factor: float = 2.5
 
+    # Sample buffers are reused by all iterations
+    x = np.empty(n_samples)
+    y = np.empty(n_samples)
+
     for iteration in range(n_iterations):
         counter: int = iteration + 1
-        x = []
-        y = []
 
         logger.debug("Conducting steady state check at iteration=%s...", counter)
 
         for i in range(n_samples):
-            t0 = time.time()
+            t0 = time.monotonic()
             value = callback()
-            t1 = time.time()
+            t1 = time.monotonic()
             dt = t1 - t0
 
-            x.append(t1)
-            y.append(value)
+            x[i] = t1
+            y[i] = value
 
             if dt <= waiting_time:
                 time.sleep(abs(dt - waiting_time))
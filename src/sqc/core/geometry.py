@@ -1,17 +1,14 @@
+import itertools
 import math
 import os
 import re
-from typing import Any, Dict, Generator, List, Optional, TextIO, Tuple
+from typing import Any, Dict, Generator, List, Optional, Set, TextIO, Tuple
 
-from .utils import extract_slice
+import numpy as np
 
-__all__ = ["Pad", "Padfile", "NeedlesGeometry", "load", "dump"]
 
+__all__ = ["Pad", "Padfile", "NeedlesGeometry", "load", "dump"]
 
-# Python < 3.8
-# See https://docs.python.org/3/library/math.html#math.dist
-if not hasattr(math, "dist"):
-    math.dist = lambda p, q: math.sqrt(sum((px - qx) ** 2.0 for px, qx in zip(p, q)))  # type: ignore
 
 Position = Tuple[int, int, int]
 
@@ -23,6 +20,8 @@ class Pad:
     relative position of the pad on the sensor.
     """
 
+    __slots__ = ("name", "x", "y", "z")
+
     def __init__(self, name: str, x: int, y: int, z: int) -> None:
         self.name: str = name
         self.x: int = x
@@ -35,13 +34,16 @@ class Pad:
 
     def distance(self, other: "Pad") -> float:
         """Retrun the relative distance to the `other` pad."""
-        return math.dist(self.position, other.position)  # type: ignore
+        return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Pad):
             raise NotImplementedError
         return (self.name, self.position) == (other.name, other.position)
 
+    def __hash__(self) -> int:
+        return hash((self.name, self.position))
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}(\'{self.name}\', {self.x}, {self.y}, {self.z})"
 
@@ -52,6 +54,9 @@ class Padfile:
         self.properties: Dict[str, Any] = {}
         self.pads: Dict[str, Pad] = {}
         self.references: List[Pad] = []
+        self._index: Dict[str, int] = {}
+        self._reference_names: Set[str] = set()
+        self._coordinates: Optional[np.ndarray] = None
 
     def set_property(self, name: str, value: Any) -> None:
         self.properties[name] = value
@@ -59,29 +64,64 @@ class Padfile:
     def add_pad(self, name: str, x: int, y: int, z: int) -> None:
         if name in self.pads:
             raise KeyError(f"Pad already exists: {name}")
+        self._index[name] = len(self.pads)
         self.pads[name] = Pad(name, x, y, z)
+        self._coordinates = None
 
     def set_reference(self, name: str) -> None:
         pad = self.pads.get(name)
         if pad is None:
             raise KeyError(f"No such reference pad: {name}")
-        if pad not in self.references:
+        if name not in self._reference_names:
+            self._reference_names.add(name)
             self.references.append(pad)
 
     def index(self, name: str) -> int:
         """Return pad index for name."""
-        return list(self.pads.keys()).index(name)
+        try:
+            return self._index[name]
+        except KeyError:
+            raise ValueError(f"No such pad: {name}") from None
 
     def slice(self, start: str, end: str) -> List[Optional[Pad]]:
         """Return slice of pads beginning with `start` up to `end`."""
-        sorted_keys = extract_slice(list(self.pads.keys()), start, end)
-        return [self.pads.get(key) for key in sorted_keys]
+        start_index: int = self.index(start)
+        end_index: int = self.index(end)
+        if not start_index <= end_index:
+            raise ValueError(f"invalid pad slice: {start}, {end}")
+        return list(itertools.islice(self.pads.values(), start_index, end_index + 1))
+
+    def coordinates(self) -> np.ndarray:
+        """Return pad coordinates as array of shape (3, N) in pad order, with
+        rows x, y and z. The read-only array is cached until the next pad is
+        added.
+        """
+        if self._coordinates is None:
+            coordinates = np.array([pad.position for pad in self.pads.values()], dtype=float)
+            self._coordinates = np.ascontiguousarray(coordinates.reshape(-1, 3).T)
+            self._coordinates.flags.writeable = False
+        return self._coordinates
+
+    def distances_from(self, name: str) -> np.ndarray:
+        """Return distances of all pads to pad `name` in pad order."""
+        pad = self.pads[name]
+        xs, ys, zs = self.coordinates()
+        return np.hypot(np.hypot(xs - pad.x, ys - pad.y), zs - pad.z)
+
+    def nearest(self, position: Position) -> Optional[Pad]:
+        """Return pad closest to position or `None` if padfile is empty."""
+        if not self.pads:
+            return None
+        x, y, z = position
+        xs, ys, zs = self.coordinates()
+        index = int(np.argmin((xs - x) ** 2 + (ys - y) ** 2 + (zs - z) ** 2))
+        return next(itertools.islice(self.pads.values(), index, None))
 
     def find_pad(self, position: Position) -> Optional[Pad]:
         """Return pad at position or `None` if no pad at position found."""
-        for pad in self.pads.values():
-            if pad.position == position:
-                return pad
+        pad = self.nearest(position)
+        if pad is not None and pad.position == position:
+            return pad
         return None
 
 
@@ -109,7 +149,6 @@ class NeedlesGeometry:
         return True
 
 
-regex_comment = re.compile(r'^#')
 regex_property = re.compile(r'^([^\:]+)\:(.*)$')
 regex_header = re.compile(r'^strip\s+x\s+y\s+z$')
 regex_pad = re.compile(r'^(\w+)\s+([+-]?\d+)\s+([+-]?\d+)\s+([+-]?\d+)$')
@@ -153,25 +192,27 @@ def load(fp: TextIO) -> Padfile:
         line = line.strip()
         if not line:
             continue
-        if regex_comment.match(line):
-            continue
-        if regex_header.match(line):
-            continue
-        # Properties
-        prop = read_property(line)
-        if prop is not None:
-            name, value = prop
-            if name == "reference_pad":
-                references.append(value)
-            else:
-                padfile.set_property(name, value)
+        if line.startswith("#"):
             continue
+        # Properties, pad names never contain a colon
+        if ":" in line:
+            prop = read_property(line)
+            if prop is not None:
+                name, value = prop
+                if name == "reference_pad":
+                    references.append(value)
+                else:
+                    padfile.set_property(name, value)
+                continue
+            raise ValueError(line)
         # Pads
         pad = read_pad(line)
         if pad is not None:
             name, x, y, z = pad
             padfile.add_pad(name, x, y, z)
             continue
+        if regex_header.match(line):
+            continue
         raise ValueError(line)
     # Set reference pads
     for name in references:
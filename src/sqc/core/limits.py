@@ -1,5 +1,7 @@
 import math
-from typing import Iterable, Tuple
+from typing import Iterable, Sized, Tuple
+
+import numpy as np
 
 __all__ = ["LimitsAggregator"]
 
@@ -25,8 +27,14 @@ class LimitsAggregator:
 
     def add(self, points: Iterable) -> None:
         """Aggregate limits from series of points."""
-        for x, y in points:
-            self.xmin = float(min(x, self.xmin))
-            self.ymin = float(min(y, self.ymin))
-            self.xmax = float(max(x, self.xmax))
-            self.ymax = float(max(y, self.ymax))
+        if not isinstance(points, Sized):
+            points = list(points)
+        if not len(points):
+            return
+        array = np.asarray(points, dtype=float).reshape(-1, 2)
+        xmin, ymin = array.min(axis=0)
+        xmax, ymax = array.max(axis=0)
+        self.xmin = float(min(xmin, self.xmin))
+        self.ymin = float(min(ymin, self.ymin))
+        self.xmax = float(max(xmax, self.xmax))
+        self.ymax = float(max(ymax, self.ymax))
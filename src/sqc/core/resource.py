@@ -1,5 +1,7 @@
+import contextlib
 import logging
-from typing import Dict
+import threading
+from typing import Dict, Generator, Optional
 
 import pyvisa
 from comet.driver import Driver
@@ -8,6 +10,9 @@ logger = logging.getLogger(__name__)
 
 driver_registry: Dict[str, Driver] = {}
 
+_resource_managers: Dict[str, pyvisa.ResourceManager] = {}
+_resource_managers_lock = threading.Lock()
+
 
 def create_driver(model: str) -> Driver:
     if model not in driver_registry:
@@ -15,6 +20,18 @@ def create_driver(model: str) -> Driver:
     return driver_registry.get(model)
 
 
+def get_resource_manager(visa_library: str) -> pyvisa.ResourceManager:
+    """Return resource manager shared by all resources using VISA library,
+    created on first use.
+    """
+    # pyvisa already reuses one ResourceManager per library, but creating it
+    # is not thread safe; serialize first use for concurrent open_resources.
+    with _resource_managers_lock:
+        if visa_library not in _resource_managers:
+            _resource_managers[visa_library] = pyvisa.ResourceManager(visa_library)
+        return _resource_managers[visa_library]
+
+
 def to_millisec(seconds: float) -> int:
     return int(seconds * 1e3)
 
@@ -39,15 +56,18 @@ class Resource:
         self.address: str = address
         self.termination: str = termination
         self.timeout: float = timeout
+        self.chunk_size: Optional[int] = None  # pyvisa default if not set
 
     def __enter__(self):
         options = {
             "resource_name": self.address,
             "read_termination": self.termination,
             "write_termination": self.termination,
-            "timeout": to_millisec(self.timeout)
+            "timeout": to_millisec(self.timeout),
         }
-        rm = pyvisa.ResourceManager(self.visa_library)
+        if self.chunk_size is not None:
+            options["chunk_size"] = self.chunk_size
+        rm = get_resource_manager(self.visa_library)
         try:
             setattr(self, "_resource", rm.open_resource(**options))
         except Exception as exc:
@@ -86,5 +106,16 @@ class Resource:
             error_message = f"Failed to write to resource: {format_resource(self)}: {format_exception(exc)}"
             raise ResourceError(error_message) from exc
 
+    @contextlib.contextmanager
+    def temporary_timeout(self, timeout: float) -> Generator[None, None, None]:
+        """Context manager temporarily changing timeout of opened resource."""
+        resource = getattr(self, "_resource")
+        previous_timeout = resource.timeout
+        resource.timeout = to_millisec(timeout)
+        try:
+            yield
+        finally:
+            resource.timeout = previous_timeout
+
     def clear(self):
         getattr(self, "_resource").clear()
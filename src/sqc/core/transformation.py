@@ -1,9 +1,11 @@
 """Module providing tools for three dimensional affine transformation."""
 
+from typing import Callable
+
 import numpy as np
 from numpy.linalg import inv
 
-__all__ = ["affine_transformation", "transform"]
+__all__ = ["affine_transformation", "transform", "make_transformer"]
 
 
 def affine_transformation(s1, s2, s3, t1, t2, t3) -> tuple:
@@ -42,5 +44,21 @@ def transform(T, V0, p) -> tuple:
     """This function transforms a Vector from the sensor system to the table
     system by vs * T + V0 = vt
     """
-    p = np.add(np.array(p[:2]).dot(T), V0).tolist()
-    return tuple(p)
+    return make_transformer(T, V0)(p)
+
+
+def make_transformer(T, V0) -> Callable[..., tuple]:
+    """Return function transforming vectors from the sensor system to the
+    table system by vs * T + V0 = vt, matrix coefficients are unpacked once.
+    """
+    try:
+        (t0, t1, t2), (t3, t4, t5) = T
+        v0, v1, v2 = V0
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid transformation matrix: T={T} V0={V0}") from exc
+
+    def transformer(p) -> tuple:
+        x, y = p[0], p[1]
+        return x * t0 + y * t3 + v0, x * t1 + y * t4 + v1, x * t2 + y * t5 + v2
+
+    return transformer
@@ -2,13 +2,15 @@ import os
 import re
 import subprocess
 import sys
-from typing import Generator, List, Tuple
+from typing import Generator, List, Sequence, Tuple
 
+import numpy as np
 from comet.utils import inverse_square
 
 __all__ = [
     "tokenize",
     "cv_inverse_square",
+    "cv_inverse_square_batch",
     "extract_slice",
     "create_slices",
     "normalize_strip_expression",
@@ -19,10 +21,14 @@ __all__ = [
     "open_directory",
 ]
 
+regex_strip_token = re.compile(r'\b\d+\s*-\s*\d+\b|[^\s,]+')
+regex_strip_range_separator = re.compile(r'\s*-\s*')
+regex_strip_separator = re.compile(r"\s*\,\s*")
+
 
 def tokenize(expression: str, separator: str) -> Generator[str, None, None]:
     """Tokenize expression using separator, empty tokens are omitted."""
-    return (t.strip() for t in expression.split(separator) if t.strip())
+    return (token for token in map(str.strip, expression.split(separator)) if token)
 
 
 def cv_inverse_square(x: float, y: float) -> Tuple[float, float]:
@@ -30,6 +36,14 @@ def cv_inverse_square(x: float, y: float) -> Tuple[float, float]:
     return x, inverse_square(y) if y else 0.  # prevent division by zero
 
 
+def cv_inverse_square_batch(x: Sequence[float], y: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Safe inverse square transformation for CV plots applied to whole series."""
+    c = np.asarray(y, dtype=float)
+    result = np.zeros_like(c)
+    np.divide(1., np.square(c), out=result, where=c != 0)  # prevent division by zero
+    return np.asarray(x, dtype=float), result
+
+
 def extract_slice(names: List[str], start: str, end: str) -> List[str]:
     """Extract a slice from list of names."""
     start_index: int = names.index(start)
@@ -57,32 +71,41 @@ def create_slices(all: List[str], selected: List[str]) -> List[List[str]]:
 
 def normalize_strip_expression(expression: str) -> str:
     """Return normalized version of strip expression."""
-    tokens = re.findall(r'\b\d+\s*-\s*\d+\b|[^\s,]+', expression)
-    tokens = [re.sub(r'\s*-\s*', "-", token).strip() for token in tokens]
-    tokens = [token.strip("-") for token in tokens]  # strip open ranges
+    tokens = regex_strip_token.findall(expression)
+    # strip open ranges
+    tokens = [regex_strip_range_separator.sub("-", token).strip().strip("-") for token in tokens]
     return ", ".join(filter(None, tokens))
 
 
 def parse_strip_expression(expression: str) -> Generator[Tuple[str, str], None, None]:
     """Return list of tuples representing a slice of names."""
-    tokens = [token for token in re.split(r"\s*\,\s*", expression) if token]
-    for token in tokens:
+    for token in regex_strip_separator.split(expression):
+        if not token:
+            continue
         result = token.split("-", 1)
         yield result[0], result[-1]
 
 
 def parse_strips(names: List[str], expression: str) -> List[str]:
     """Return expanded list of names specified by expression."""
-    unsorted_names = set()
+    indices = {name: index for index, name in enumerate(names)}
+    selected = bytearray(len(names))
     for start, end in parse_strip_expression(expression):
-        unsorted_names.update(extract_slice(names, start, end))
-    return sorted(unsorted_names, key=names.index)
+        for name in (start, end):
+            if name not in indices:
+                raise ValueError(f"invalid pad: {name}")
+        start_index, end_index = indices[start], indices[end]
+        if not start_index <= end_index:
+            raise ValueError(f"invalid pad slice: {start}, {end}")
+        selected[start_index:end_index + 1] = b"\x01" * (end_index - start_index + 1)
+    return [name for name, flag in zip(names, selected) if flag]
 
 
 def verify_position(reference: Tuple[float, float, float], position: Tuple[float, float, float], threshold: float) -> bool:
     """Return True if both coordinates match within given threshold for values."""
+    threshold = abs(threshold)
     for a, b in zip(reference, position):
-        if abs(a - b) > abs(threshold):
+        if abs(a - b) > threshold:
             return False
     return True
 
@@ -5,7 +5,6 @@ import os
 import sys
 import time
 import subprocess
-from functools import partial
 from typing import Iterable, List, Optional, Tuple, Optional
 
 import numpy as np
@@ -18,7 +17,7 @@ from ..controller.needle import NeedleController
 from ..controller.table import TableController
 from ..core.camera import camera_registry, Camera, DummyCamera
 from ..core.geometry import Pad, Padfile, NeedlesGeometry
-from ..core.transformation import affine_transformation, transform
+from ..core.transformation import affine_transformation, make_transformer
 from ..settings import Settings
 
 from .calibration import TableCalibrationDialog, NeedlesCalibrationDialog
@@ -304,7 +303,11 @@ class AlignmentController:
             t3 = items[2].position()
             T, V0 = affine_transformation(s1, s2, s3, t1, t2, t3)
             logger.info("Calculated transformation: %s %s", T, V0)
-            self._transform = partial(transform, T, V0)
+            try:
+                self._transform = make_transformer(T, V0)
+            except ValueError as exc:
+                logger.error(exc)
+                self._transform = None
 
     def transform(self, position: Position) -> Position:
         if not self._transform:
@@ -1392,13 +1395,14 @@ class AlignmentDialog(QtWidgets.QDialog):
         settings.beginGroup("camera")
         model = settings.value("model", "ueye", str)  # TODO
         deviceId = settings.value("deviceId", 0, int)
+        bufferCount = settings.value("bufferCount", 0, int)
         settings.endGroup()
         try:
             # Camera
             camera_cls = camera_registry.get(model)
             if camera_cls is None:
                 camera_cls = DummyCamera
-            camera = camera_cls({"device_id": deviceId})  # TODO
+            camera = camera_cls({"device_id": deviceId, "buffer_count": bufferCount})  # TODO
             if isinstance(camera, Camera):
                 self.setCamera(camera)
                 self.startCamera()
@@ -5,9 +5,10 @@ from pathlib import Path
 from collections import Counter
 from typing import Any, Dict, Tuple, Optional
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from ..core.utils import cv_inverse_square
+from ..core.utils import cv_inverse_square_batch
 
 from .plotarea import PlotAreaWidget
 from .plotwidget import (
@@ -372,7 +373,7 @@ class DashboardWidget(QtWidgets.QWidget):
         # Apply transformation on plot data
         self.ivcPlotAreaWidget.setTransformation("iv", lambda x, y: (x, abs(y)))
         self.ivcPlotAreaWidget.setTransformation("cv", lambda x, y: (x, abs(y)))
-        self.ivcPlotAreaWidget.setTransformation("cvfd", lambda x, y: cv_inverse_square(x, abs(y)))
+        self.ivcPlotAreaWidget.setBatchTransformation("cvfd", lambda x, y: cv_inverse_square_batch(x, np.abs(y)))
 
         # TODO move to plots?
         self.ivcPlotAreaWidget.setMapping("iv", "bias_smu_v", "bias_smu_i")
@@ -3,10 +3,11 @@ import os
 import json
 from datetime import datetime
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from ..core.limits import LimitsAggregator
-from ..core.utils import cv_inverse_square
+from ..core.utils import cv_inverse_square_batch
 
 from . import aboutMessage, showContents, showGithub
 from .plotwidget import (
@@ -41,7 +42,7 @@ def createDataMapper():
 
     mapper.setTransformation("iv", lambda x, y: (x, abs(y)))
     mapper.setTransformation("cv", lambda x, y: (x, abs(y)))
-    mapper.setTransformation("cvfd", lambda x, y: cv_inverse_square(x, abs(y)))
+    mapper.setBatchTransformation("cvfd", lambda x, y: cv_inverse_square_batch(x, np.abs(y)))
     mapper.setTransformation("rpoly", lambda x, y: (x, abs(y)))
     mapper.setTransformation("istrip", lambda x, y: (x, abs(y)))
     mapper.setTransformation("idiel", lambda x, y: (x, abs(y)))
@@ -76,6 +76,9 @@ class PlotAreaWidget(QtWidgets.QWidget):
     def setTransformation(self, type: str, function: Callable) -> None:
         self._mapper.setTransformation(type, function)
 
+    def setBatchTransformation(self, type: str, function: Callable) -> None:
+        self._mapper.setBatchTransformation(type, function)
+
     def updateLayout(self):
         for index, action in enumerate(self._showActionGroup.actions()):
             action.setVisible(index < len(self._plotWidgets))
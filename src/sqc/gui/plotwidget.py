@@ -1,6 +1,9 @@
+import bisect
 import logging
+import math
 from typing import Callable, Dict, Iterator, Optional
 
+import numpy as np
 from PyQt5 import QtChart, QtCore, QtGui, QtWidgets
 
 from ..core.limits import LimitsAggregator
@@ -17,30 +20,39 @@ __all__ = [
 ]
 
 
+scales = (
+    (1e-24, "y", "yocto"),
+    (1e-21, "z", "zepto"),
+    (1e-18, "a", "atto"),
+    (1e-15, "f", "femto"),
+    (1e-12, "p", "pico"),
+    (1e-9, "n", "nano"),
+    (1e-6, "u", "micro"),
+    (1e-3, "m", "milli"),
+    (1e+0, "", ""),
+    (1e+3, "k", "kilo"),
+    (1e+6, "M", "mega"),
+    (1e+9, "G", "giga"),
+    (1e+12, "T", "tera"),
+    (1e+15, "P", "peta"),
+    (1e+18, "E", "exa"),
+    (1e+21, "Z", "zetta"),
+    (1e+24, "Y", "yotta"),
+)
+scale_values = tuple(scale for scale, _, _ in scales)
+
+
 def auto_scale(value):
-    scales = (
-        (1e+24, "Y", "yotta"),
-        (1e+21, "Z", "zetta"),
-        (1e+18, "E", "exa"),
-        (1e+15, "P", "peta"),
-        (1e+12, "T", "tera"),
-        (1e+9, "G", "giga"),
-        (1e+6, "M", "mega"),
-        (1e+3, "k", "kilo"),
-        (1e+0, "", ""),
-        (1e-3, "m", "milli"),
-        (1e-6, "u", "micro"),
-        (1e-9, "n", "nano"),
-        (1e-12, "p", "pico"),
-        (1e-15, "f", "femto"),
-        (1e-18, "a", "atto"),
-        (1e-21, "z", "zepto"),
-        (1e-24, "y", "yocto")
-    )
-    for scale, prefix, name in scales:
-        if abs(value) >= scale:
-            return scale, prefix, name
-    return 1e0, "", ""
+    """Return largest scale not exceeding absolute value, looked up by
+    bisection of the ascending scales table.
+    """
+    value = abs(value)
+    if math.isnan(value):
+        return 1e0, "", ""
+    index = bisect.bisect_right(scale_values, value) - 1
+    if index < 0:
+        return 1e0, "", ""
+    return scales[index]
 
 
 class DataMapper:
@@ -48,6 +60,7 @@ class DataMapper:
     def __init__(self) -> None:
         self._mapping: dict[str, tuple[str, str]] = {}
         self._transformation: dict[str, Callable] = {}
+        self._batchTransformation: dict[str, Callable] = {}
 
     def setMapping(self, name: str, x: str, y: str) -> None:
         self._mapping[name] = x, y
@@ -55,10 +68,18 @@ class DataMapper:
     def setTransformation(self, name: str, f: Callable[[float, float], tuple[float, float]]) -> None:
         self._transformation[name] = f
 
+    def setBatchTransformation(self, name: str, f: Callable[[list, list], tuple]) -> None:
+        """Set transformation applied to all x and y values of a series at once."""
+        self._batchTransformation[name] = f
+
     def __call__(self, name: str, items: list) -> Iterator:
         if name not in self._mapping:
             raise KeyError(f"No such series: {name!r}")
         x, y = self._mapping[name]
+        batch_tr = self._batchTransformation.get(name)
+        if batch_tr is not None:
+            xs, ys = batch_tr([item.get(x) for item in items], [item.get(y) for item in items])
+            return zip(np.asarray(xs).tolist(), np.asarray(ys).tolist())
         tr = self._transformation.get(name, lambda x, y: (x, y))
         return (tr(item.get(x), item.get(y)) for item in items)
 
@@ -361,13 +382,10 @@ class PlotWidget(QtWidgets.QWidget):
         limits = LimitsAggregator()
         for series in self._chart.series():
             if isinstance(series, QtChart.QXYSeries):
-                for point in series.pointsVector():
-                    x = point.x()
-                    y = point.y()
-                    if xmin is not None and xmax is not None:
-                        if not (xmin <= x <= xmax):
-                            continue
-                    limits.add([(x, y)])
+                points = [(point.x(), point.y()) for point in series.pointsVector()]
+                if xmin is not None and xmax is not None:
+                    points = [(x, y) for x, y in points if xmin <= x <= xmax]
+                limits.add(points)
         return limits
 
     def fitAllSeries(self, xmin=None, xmax=None):
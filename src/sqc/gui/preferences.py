@@ -157,9 +157,15 @@ class CameraWidget(QtWidgets.QWidget):
         self.deviceIdSpinBox = QtWidgets.QSpinBox(self)
         self.deviceIdSpinBox.setRange(0, 100)
 
+        self.bufferCountSpinBox = QtWidgets.QSpinBox(self)
+        self.bufferCountSpinBox.setRange(0, 100)
+        self.bufferCountSpinBox.setSpecialValueText("Auto")
+        self.bufferCountSpinBox.setToolTip("Number of driver image buffers, each holding one full frame.")
+
         layout = QtWidgets.QFormLayout(self)
         layout.addRow("Model", self.cameraComboBox)
         layout.addRow("Device ID", self.deviceIdSpinBox)
+        layout.addRow("Buffer Count", self.bufferCountSpinBox)
 
     def addCamera(self, model: str) -> None:
         self.cameraComboBox.addItem(model, model)
@@ -169,17 +175,21 @@ class CameraWidget(QtWidgets.QWidget):
         settings.beginGroup("camera")
         model = settings.value("model", "", str)
         deviceId = settings.value("deviceId", 0, int)
+        bufferCount = settings.value("bufferCount", 0, int)
         settings.endGroup()
         index = self.cameraComboBox.findData(model)
         if index >= 0:
             self.cameraComboBox.setCurrentIndex(index)
         self.deviceIdSpinBox.setValue(deviceId)
+        self.bufferCountSpinBox.setValue(bufferCount)
 
     def saveValues(self) -> None:
         model = self.cameraComboBox.currentData()
         deviceId = self.deviceIdSpinBox.value()
+        bufferCount = self.bufferCountSpinBox.value()
         settings = QtCore.QSettings()
         settings.beginGroup("camera")
         settings.setValue("model", model)
         settings.setValue("deviceId", deviceId)
+        settings.setValue("bufferCount", bufferCount)
         settings.endGroup()
@@ -524,9 +524,11 @@ class CacMeasurement(SingleStripMeasurement):
     def acquire(self):
         station = self.context.station
 
+        # Open correction does not change while acquiring a strip
+        cp_corr = self.context.get_open_correction(self.namespace, self.type, self.name, "cp")
+
         def apply_correction(cp_value, rp_value):
             # TODO
-            cp_corr = self.context.get_open_correction(self.namespace, self.type, self.name, "cp")
             logger.info("Cac cp correction: corr=%G, value=%G, (value-corr)=%G", cp_corr, cp_value, cp_value - cp_corr)
             return cp_value - cp_corr, rp_value
 
@@ -546,8 +548,7 @@ class CacMeasurement(SingleStripMeasurement):
         logger.info("Acquire readings...")
         readings = [lcr_acquire_corr_reading() for _ in range(self.n_samples)]
 
-        cac_cp = np.median([reading[0] for reading in readings])
-        cac_rp = np.median([reading[1] for reading in readings])
+        cac_cp, cac_rp = np.median(readings, axis=0)
 
         self.insert_strip_data({"cac_cp": cac_cp, "cac_rp": cac_rp})
 
@@ -608,9 +609,11 @@ class CIntMeasurement(SingleStripMeasurement):
     def acquire(self):
         station = self.context.station
 
+        # Open correction does not change while acquiring a strip
+        cp_corr = self.context.get_open_correction(self.namespace, self.type, self.name, "cp")
+
         def apply_correction(cp_value, rp_value):
             # TODO
-            cp_corr = self.context.get_open_correction(self.namespace, self.type, self.name, "cp")
             logger.info("CInt cp correction: corr=%G, value=%G, (value-corr)=%G", cp_corr, cp_value, cp_value - cp_corr)
             return cp_value - cp_corr, rp_value
 
@@ -630,8 +633,7 @@ class CIntMeasurement(SingleStripMeasurement):
         logger.info("Acquire readings...")
         readings = [lcr_acquire_corr_reading() for _ in range(self.n_samples)]
 
-        cint_cp = np.median([reading[0] for reading in readings])
-        cint_rp = np.median([reading[1] for reading in readings])
+        cint_cp, cint_rp = np.median(readings, axis=0)
 
         self.insert_strip_data({"cint_cp": cint_cp, "cint_rp": cint_rp})
 
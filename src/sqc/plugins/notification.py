@@ -62,14 +62,18 @@ def message_kwargs(context) -> dict:
     }
 
 
+regex_placeholder = re.compile(r'\{(.*?)\}')
+
+
 def safe_format(template: str, kwargs: dict) -> str:
-    pattern = re.compile(r'\{(.*?)\}')
+    if "{" not in template:
+        return template  # nothing to replace
 
     def replacer(match):
         key = match.group(1)
         return kwargs.get(key, match.group(0))
 
-    return pattern.sub(replacer, template)
+    return regex_placeholder.sub(replacer, template)
 
 
 def publish_message(message: str) -> None:
@@ -1,5 +1,6 @@
 import ctypes
 import logging
+import struct
 import threading
 import time
 
@@ -7,9 +8,12 @@ import numpy as np
 from pyueye import ueye
 
 from sqc.core.camera import Camera as BaseCamera
+from sqc.core.camera import FrameQueue
 
 __all__ = ["UEyeCamera"]
 
+logger = logging.getLogger(__name__)
+
 
 def get_bits_per_pixel(color_mode):
     """
@@ -41,6 +45,11 @@ def get_bits_per_pixel(color_mode):
     }[color_mode]
 
 
+def get_channels(bits_per_pixel):
+    """Returns the number of bytes per pixel used as image channels."""
+    return int((7 + bits_per_pixel) / 8)
+
+
 def check(ret):
     if ret != ueye.IS_SUCCESS:
         raise RuntimeError(ret)
@@ -74,10 +83,16 @@ class CameraInfo:
 
 class SensorInfo:
 
+    # Single byte fields nColorMode and nUpperLeftBayerPixel
+    byte_fields = struct.Struct(">BB")
+
     def __init__(self, info):
+        # pyueye c_char fields are ctypes instances, read their raw bytes
+        self.nColorMode, self.nUpperLeftBayerPixel = self.byte_fields.unpack(
+            bytes(info.nColorMode) + bytes(info.nUpperLeftBayerPixel)
+        )
         self.SensorID = int(info.SensorID)
         self.strSensorName = info.strSensorName.decode("utf-8")
-        self.nColorMode = int.from_bytes(info.nColorMode, "big")
         self.nMaxWidth = info.nMaxWidth.value
         self.nMaxHeight = info.nMaxHeight.value
         self.bMasterGain = info.bMasterGain.value
@@ -86,22 +101,25 @@ class SensorInfo:
         self.bBGain = info.bBGain.value
         self.bGlobShutter = info.bGlobShutter.value
         self.wPixelSize = info.wPixelSize.value
-        self.nUpperLeftBayerPixel = int.from_bytes(info.nUpperLeftBayerPixel, "big")
         self.Reserved = info.Reserved.decode("utf-8")
 
 
 class MemoryInfo:
-    def __init__(self, h_cam, img_buff):
+    def __init__(self, h_cam, img_buff, aoi=None):
         self.x = ueye.int()
         self.y = ueye.int()
         self.bits = ueye.int()
         self.pitch = ueye.int()
         self.img_buff = img_buff
 
-        rect_aoi = ueye.IS_RECT()
-        check(ueye.is_AOI(h_cam, ueye.IS_AOI_IMAGE_GET_AOI, rect_aoi, ueye.sizeof(rect_aoi)))
-        self.width = rect_aoi.s32Width.value
-        self.height = rect_aoi.s32Height.value
+        if aoi is None:
+            rect_aoi = ueye.IS_RECT()
+            check(ueye.is_AOI(h_cam, ueye.IS_AOI_IMAGE_GET_AOI, rect_aoi, ueye.sizeof(rect_aoi)))
+            self.width = rect_aoi.s32Width.value
+            self.height = rect_aoi.s32Height.value
+        else:
+            self.width = aoi.width
+            self.height = aoi.height
 
         check(ueye.is_InquireImageMem(
             h_cam,
@@ -115,23 +133,27 @@ class MemoryInfo:
 
 
 class ImageData:
-    def __init__(self, h_cam, img_buff):
+    def __init__(self, h_cam, img_buff, aoi=None, bits_per_pixel=None, channels=None):
         self.h_cam = h_cam
         self.img_buff = img_buff
-        self.mem_info = MemoryInfo(h_cam, img_buff)
-        self.color_mode = ueye.is_SetColorMode(h_cam, ueye.IS_GET_COLOR_MODE)
-        self.bits_per_pixel = get_bits_per_pixel(self.color_mode)
+        self.mem_info = MemoryInfo(h_cam, img_buff, aoi)
+        if bits_per_pixel is None:
+            bits_per_pixel = get_bits_per_pixel(ueye.is_SetColorMode(h_cam, ueye.IS_GET_COLOR_MODE))
+        self.bits_per_pixel = bits_per_pixel
+        if channels is None:
+            channels = get_channels(bits_per_pixel)
+        self.channels = channels
         self.array = ueye.get_data(
             self.img_buff.mem_ptr,
             self.mem_info.width,
             self.mem_info.height,
             self.mem_info.bits,
             self.mem_info.pitch,
-            True,
+            False,  # view of locked image memory, copy before unlock
         )
 
     def as_1d_image(self):
-        channels = int((7 + self.bits_per_pixel) / 8)
+        channels = self.channels
         if channels > 1:
             return np.reshape(self.array, (self.mem_info.height, self.mem_info.width, channels))
         else:
@@ -146,10 +168,20 @@ class Camera:
     def __init__(self, device_id=0):
         self.h_cam = ueye.HIDS(device_id)
         self.img_buffers = []
+        self.aoi_rect = None
+        self.color_mode = None
+        self.bits_per_pixel = None
+        self.channels = None
+        self.sensor_info = None
+        self.frame_rate = None
 
     def handle(self):
         return self.h_cam
 
+    def aoi(self):
+        """Return AOI the image buffers were allocated for."""
+        return self.aoi_rect
+
     def init(self):
         check(ueye.is_InitCamera(self.h_cam, None))
 
@@ -176,6 +208,9 @@ class Camera:
 
         ueye.is_InitImageQueue(self.h_cam, 0)
 
+        # AOI does not change while streaming into allocated buffers
+        self.aoi_rect = rect
+
     def get_camera_info(self):
         info = ueye.CAMINFO()
         check(ueye.is_GetCameraInfo(self.h_cam, info))
@@ -268,7 +303,14 @@ class Camera:
         return ueye.is_FreezeVideo(self.h_cam, wait_param)
 
     def set_colormode(self, colormode):
+        self.color_mode = None
+        self.bits_per_pixel = None
+        self.channels = None
         check(ueye.is_SetColorMode(self.h_cam, colormode))
+        # Color mode does not change while streaming, cache derived values
+        self.color_mode = colormode
+        self.bits_per_pixel = get_bits_per_pixel(colormode)
+        self.channels = get_channels(self.bits_per_pixel)
 
     def get_colormode(self):
         ret = ueye.is_SetColorMode(self.h_cam, ueye.IS_GET_COLOR_MODE)
@@ -296,57 +338,146 @@ class Camera:
 
     def configure(self):
         sensor_info = self.get_sensor_info()
+        self.sensor_info = sensor_info
         self.reset_to_default()
         self.set_colormode(ueye.IS_CM_BGR8_PACKED)
         self.set_aoi(0, 0, sensor_info.nMaxWidth, sensor_info.nMaxHeight)
         self.set_binning(ueye.IS_BINNING_2X_VERTICAL | ueye.IS_BINNING_2X_HORIZONTAL)
         fmin, fmax = self.get_fps_range()
-        self.set_fps(min(fmax, 25))
+        self.frame_rate = self.set_fps(min(fmax, 25))
         self.set_auto_parameter(ueye.IS_SET_ENABLE_AUTO_WHITEBALANCE)
         self.set_auto_parameter(ueye.IS_SET_AUTO_WB_AOI)
         self.set_auto_parameter(ueye.IS_SET_AUTO_BRIGHT_AOI)
 
 
+class CaptureStatistics:
+    """Frame acquisition counters, reported every `interval` seconds or
+    `max_frames` frames."""
+
+    def __init__(self, interval: float = 5.0, max_frames: int = 1000) -> None:
+        self.interval: float = interval
+        self.max_frames: int = max_frames
+        self.reset()
+
+    def reset(self) -> None:
+        self.frames_ok: int = 0
+        self.frames_timeout: int = 0
+        self.frames_error: int = 0
+        self.frames_dropped: int = 0
+        self.max_wait: float = 0.
+        self.t: float = time.monotonic()
+
+    def add_wait(self, ret: int, wait_time: float) -> None:
+        if ret == ueye.IS_SUCCESS:
+            self.frames_ok += 1
+        elif ret == ueye.IS_TIMED_OUT:
+            self.frames_timeout += 1
+        else:
+            self.frames_error += 1
+        self.max_wait = max(self.max_wait, wait_time)
+
+    def is_due(self) -> bool:
+        frames = self.frames_ok + self.frames_timeout + self.frames_error
+        return frames >= self.max_frames or time.monotonic() - self.t >= self.interval
+
+    def report(self) -> None:
+        # Healthy acquisition is only of interest when debugging
+        healthy = not (self.frames_timeout or self.frames_error or self.frames_dropped)
+        logger.log(
+            logging.DEBUG if healthy else logging.WARNING,
+            "ueye: ok=%d timeout=%d err=%d dropped=%d max_wait=%.1fms",
+            self.frames_ok,
+            self.frames_timeout,
+            self.frames_error,
+            self.frames_dropped,
+            self.max_wait * 1e3,
+        )
+        self.reset()
+
+
 class UEyeCamera(BaseCamera):
 
     def __init__(self, config) -> None:
         super().__init__(config)
-        self.free_running: bool = False
+        self.stop_event = threading.Event()
         self.timeout: int = 1000
         self.camera = Camera(config.get("device_id", 0))
         self.camera.init()
         self.camera.configure()
-        self.camera.alloc()
+        self.camera.alloc(buffer_count=config.get("buffer_count") or self.default_buffer_count())
+        self.frame_queue: FrameQueue = FrameQueue(maxsize=4)
+        self.capture_stats = CaptureStatistics()
         self.frame_thread = threading.Thread(target=self.capture_frames)
+        self.consumer_thread = threading.Thread(target=self.consume_frames)
+
+    def default_buffer_count(self) -> int:
+        """Return number of image buffers required to hold all frames arriving
+        within one wait timeout, plus two spare buffers.
+
+        Each buffer requires width * height * bits_per_pixel / 8 bytes of memory.
+        """
+        frame_rate = self.camera.frame_rate or 0
+        return max(3, int(self.timeout / 1000 * frame_rate) + 2)
 
     def start(self) -> None:
-        self.free_running = True
+        self.stop_event.clear()
         self.camera.capture_video()
+        self.consumer_thread.start()
         self.frame_thread.start()
 
     def stop(self) -> None:
         self.camera.stop_video()
-        self.free_running = False
+        self.stop_event.set()
 
     def set_exposure(self, exposure: float) -> None:
         self.camera.set_exposure(exposure)
 
     def shutdown(self) -> None:
-        self.free_running = False
+        self.stop_event.set()
         self.camera.exit()
 
+    def enqueue_frame(self, frame_data) -> None:
+        """Enqueue frame for consumer thread, drops oldest frame if queue is full."""
+        if self.frame_queue.put(frame_data):
+            self.capture_stats.frames_dropped += 1
+
     def capture_frames(self) -> None:
-        while self.free_running:
+        # Reused for every frame, mem_ptr and mem_id are overwritten by the driver
+        img_buffer = ImageBuffer()
+        camera = self.camera
+        h_cam = camera.handle()
+        # pyueye binds the SDK using ctypes, the GIL is released while waiting
+        wait_for_next_image = ueye.is_WaitForNextImage
+        capture_stats = self.capture_stats
+        capture_stats.reset()
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    t = time.perf_counter()
+                    ret = wait_for_next_image(h_cam, self.timeout, img_buffer.mem_ptr, img_buffer.mem_id)
+                    capture_stats.add_wait(ret, time.perf_counter() - t)
+                    if capture_stats.is_due():
+                        capture_stats.report()
+                    if ret == ueye.IS_SUCCESS:
+                        image_data = ImageData(h_cam, img_buffer, camera.aoi(), camera.bits_per_pixel, camera.channels)
+                        # Single copy owned by frame handlers, made before unlock
+                        frame_data = image_data.as_1d_image().copy()
+                        image_data.unlock()
+                        self.enqueue_frame(frame_data)
+                except Exception as exc:
+                    logger.exception(exc)
+                    # throttle in case of error, returns early on stop
+                    if self.stop_event.wait(1.0):
+                        break
+        finally:
+            self.frame_queue.close()  # stop consumer thread
+
+    def consume_frames(self) -> None:
+        for frame_data in self.frame_queue:
             try:
-                img_buffer = ImageBuffer()
-                ret = ueye.is_WaitForNextImage(
-                    self.camera.handle(), self.timeout, img_buffer.mem_ptr, img_buffer.mem_id
-                )
-                if ret == ueye.IS_SUCCESS:
-                    image_data = ImageData(self.camera.handle(), img_buffer)
-                    frame_data = image_data.as_1d_image()
-                    image_data.unlock()
-                    self.handle_frame(frame_data)
+                self.handle_frame(frame_data)
             except Exception as exc:
-                logging.exception(exc)
-                time.sleep(1.0)  # throttle in case of error
+                logger.exception(exc)
+                # throttle in case of error, returns early on stop
+                if self.stop_event.wait(1.0):
+                    break
@@ -25,6 +25,11 @@ DEFAULT_LOAD_POSITION: Position = 0.0, 193309.0, 0.0
 
 DEFAULT_MEASUREMENT_POSITION: Position = 19585.0, 187568.0, 9700.0
 
+# Read up to 1 MiB per low level read from measurement instruments
+READ_CHUNK_SIZE: int = 1 << 20
+
+READ_CHUNK_SIZE_RESOURCES: Tuple[str, ...] = ("lcr", "elm", "smu", "bias_smu")
+
 DEFAULT_RESOURCES: dict = {
     "bias_smu": {"model": "K2657A", "models": ["K2657A", "K2410", "K2470"]},
     "smu": {"model": "K2410", "models": ["K2657A", "K2410", "K2470"]},
@@ -132,13 +137,16 @@ class Settings:
         settings.endArray()
 
     def createResource(self, name: str) -> Resource:
-        resource = Settings().resources().get(name, {})
-        return Resource(
-            model=resource.get("model"),
-            address=resource.get("address"),
-            termination=resource.get("termination", "\r\n"),
-            timeout=resource.get("timeout", 8.0),
+        options = self.resources().get(name, {})
+        resource = Resource(
+            model=options.get("model"),
+            address=options.get("address"),
+            termination=options.get("termination", "\r\n"),
+            timeout=options.get("timeout", 8.0),
         )
+        if name in READ_CHUNK_SIZE_RESOURCES:
+            resource.chunk_size = READ_CHUNK_SIZE
+        return resource
 
     def tableProfile(self, key: str) -> dict:
         profile = copy.deepcopy(DEFAULT_TABLE_PROFILES.get(key, {}))
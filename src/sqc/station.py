@@ -1,7 +1,9 @@
 import logging
-import statistics
+import threading
 import time
-from typing import Any, Callable, Dict, Generator, Iterable, Tuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Generator, Iterable, List, Tuple, Optional
 
 from comet.filters import std_mean_filter
 from comet.functions import LinearRange
@@ -10,9 +12,8 @@ from comet.utils import ureg
 from .controller.environ import EnvironController
 from .controller.table import Table
 from .core.event import Event
-from .core.formatting import format_channels, format_metric, format_switch
+from .core.formatting import LazyMetric, format_channels, format_switch
 from .core.resource import Resource, create_driver, Driver
-from .core.timer import Timer
 from .settings import Settings
 
 __all__ = ["Station"]
@@ -34,11 +35,56 @@ def iter_errors(instr) -> Generator[Any, None, None]:
         yield error
 
 
+def as_channel_set(channels: Iterable[str]) -> FrozenSet[str]:
+    """Return channels as frozenset, frozensets are returned unchanged."""
+    if isinstance(channels, frozenset):
+        return channels
+    return frozenset(channels)
+
+
+def switch_apply_channels(switch, channels: Iterable[str], name: str,
+                          closed_channels: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """Open removed and close missing switch channels and return verified
+    closed channels. If currently closed channels are not known, they are
+    queried from the switch.
+    """
+    channels = as_channel_set(channels)
+    if closed_channels is None:
+        closed_channels = switch.closed_channels
+    closed_channels = as_channel_set(closed_channels)
+
+    open_channels = closed_channels - channels
+    if open_channels:  # only open removed channels
+        logger.info("Open %s switch channels: %s", name, format_channels(open_channels))
+        switch.open_channels(open_channels)
+
+    close_channels = channels - closed_channels
+    if close_channels:  # only close open channels
+        logger.info("Close %s switch channels: %s", name, format_channels(close_channels))
+        switch.close_channels(close_channels)
+
+    closed_channels = frozenset(switch.closed_channels)
+    if closed_channels != channels:
+        raise RuntimeError(f"Failed to apply {name} switch channels")
+    return closed_channels
+
+
+def paced(values: Iterable[Any], interval: float) -> Generator[Any, None, None]:
+    """Yield values in fixed intervals, time spent by the consumer between
+    values counts towards the interval.
+    """
+    t = time.monotonic()
+    for value in values:
+        yield value
+        t += interval
+        time.sleep(max(0., t - time.monotonic()))
+
+
 def wait_until(callback, timeout=60.0, interval=0.250) -> None:
     """Block until callback function return `True`."""
-    t = Timer()
+    deadline = time.monotonic() + timeout
     while True:
-        if t.delta() > timeout:
+        if time.monotonic() > deadline:
             raise TimeoutError()
         time.sleep(interval)
         if callback():
@@ -49,6 +95,13 @@ class Station:
 
     def __init__(self) -> None:
         self._resources: Dict[str, Driver] = {}
+        self._resources_lock = threading.Lock()
+        # Serializes open/close of the same resource by different threads
+        self._resource_locks: Dict[str, threading.RLock] = {}
+        self._settings: Settings = Settings()
+        # Closed switch channels known from last release/apply
+        self._closed_channels: Dict[str, FrozenSet[str]] = {}
+        self._table: Optional[Table] = None
         self.registered_resources = [
             "hv_switch",
             "lv_switch",
@@ -66,30 +119,66 @@ class Station:
         self.environ: EnvironController = EnvironController()
         self.environ.start()
 
+    def _resource_lock(self, name: str) -> threading.RLock:
+        with self._resources_lock:
+            return self._resource_locks.setdefault(name, threading.RLock())
+
     def get_resource(self, name: str) -> Driver:
-        self.open_resource(name)
-        return self._resources[name]
+        with self._resource_lock(name):
+            self.open_resource(name)
+            return self._resources[name]
 
     def open_resource(self, name: str) -> None:
-        if name not in self._resources:
-            resource = Settings().createResource(name)
-            self._resources[name] = create_driver(resource.model)(resource.__enter__())
-            logger.info("Opened resource: %s %s", resource.model, resource.address)
+        with self._resource_lock(name):
+            if name not in self._resources:
+                resource = self._settings.createResource(name)
+                driver = create_driver(resource.model)(resource.__enter__())
+                self._resources[name] = driver
+                logger.info("Opened resource: %s %s", resource.model, resource.address)
 
     def close_resource(self, name: str) -> None:
-        resource = self.get_resource(name)
-        if resource is not None:
-            resource.resource.__exit__()
-            logger.info("Closed resource: %s %s", resource.resource.model, resource.resource.address)
-            del self._resources[name]
+        with self._resource_lock(name):
+            resource = self.get_resource(name)
+            if resource is not None:
+                try:
+                    resource.resource.__exit__()
+                    logger.info("Closed resource: %s %s", resource.resource.model, resource.resource.address)
+                finally:
+                    # Resource handle is released even if closing failed
+                    del self._resources[name]
+                    self._closed_channels.pop(name, None)
 
     def open_resources(self) -> None:
-        for name in self.registered_resources:
-            self.open_resource(name)
+        names = [name for name in self.registered_resources if name not in self._resources]
+        if not names:
+            return
+        # Resources are independent, open them concurrently
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(self.open_resource, name) for name in names}
+        errors: List[BaseException] = []
+        for future in futures.values():
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+        if errors:
+            # Do not leave resources opened by this call behind
+            for name, future in futures.items():
+                if future.exception() is None:
+                    try:
+                        self.close_resource(name)
+                    except Exception as exc:
+                        logger.exception(exc)
+                        logger.error("Failed to close resource: %r", name)
+            raise errors[0]
 
     def close_resources(self) -> None:
-        for name in list(self._resources.keys()):
-            self.close_resource(name)
+        while self._resources:
+            name = next(iter(self._resources))
+            try:
+                self.close_resource(name)
+            except Exception as exc:
+                logger.exception(exc)
+                logger.error("Failed to close resource: %r", name)
 
     def clear_visa_bus(self) -> None:
         for resource in self._resources.values():
@@ -131,11 +220,17 @@ class Station:
         logger.info("Safe initialize SQC... done.")
 
     def check_identities(self) -> None:
-        for name in self.registered_resources:
+        def identify_resource(name: str) -> str:
             instr = self.get_resource(name)
             if instr is None:
                 raise ValueError(f"No such resource: {name!r}")
-            logger.info("Identified %s: %s", name, identify(instr))
+            return identify(instr)
+
+        # Resources are independent, identify them concurrently
+        names = self.registered_resources
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            for name, identity in zip(names, executor.map(identify_resource, names)):
+                logger.info("Identified %s: %s", name, identity)
 
     def safe_discharge(self) -> None:
         self.safe_recover_bias_smu()
@@ -148,59 +243,42 @@ class Station:
     def hv_switch_release(self) -> None:
         logger.info("Release all HV switch channels.")
         hv_switch = self.get_resource("hv_switch")
+        self._closed_channels.pop("hv_switch", None)
 
         hv_switch.open_all_channels()
 
         closed_channels = hv_switch.closed_channels
         if closed_channels:
             raise RuntimeError(f"Failed to release HV switch channels: {closed_channels}")
+        self._closed_channels["hv_switch"] = frozenset()
 
     def hv_switch_apply(self, channels: Iterable[str]) -> None:
+        channels = as_channel_set(channels)
         logger.info("Apply HV switch channels: %s", format_channels(channels))
         hv_switch = self.get_resource("hv_switch")
-
-        open_channels = set(hv_switch.closed_channels) - set(channels)
-        if open_channels:  # only open removed channels
-            logger.info("Open HV switch channels: %s", format_channels(open_channels))
-            hv_switch.open_channels(open_channels)
-
-        close_channels = set(channels) - set(hv_switch.closed_channels)
-        if close_channels:  # only close open channels
-            logger.info("Close HV switch channels: %s", format_channels(close_channels))
-            hv_switch.close_channels(close_channels)
-
-        if set(hv_switch.closed_channels) != set(channels):
-            raise RuntimeError("Failed to apply HV switch channels")
+        closed_channels = self._closed_channels.pop("hv_switch", None)
+        self._closed_channels["hv_switch"] = switch_apply_channels(hv_switch, channels, "HV", closed_channels)
 
     # LV Switch
 
     def lv_switch_release(self) -> None:
         logger.info("Release all LV switch channels.")
         lv_switch = self.get_resource("lv_switch")
+        self._closed_channels.pop("lv_switch", None)
 
         lv_switch.open_all_channels()
 
         closed_channels = lv_switch.closed_channels
         if closed_channels:
             raise RuntimeError(f"Failed to release LV channels: {closed_channels}")
+        self._closed_channels["lv_switch"] = frozenset()
 
     def lv_switch_apply(self, channels: Iterable[str]) -> None:
+        channels = as_channel_set(channels)
         logger.info("Apply LV switch channels: %s", format_channels(channels))
         lv_switch = self.get_resource("lv_switch")
-
-        open_channels = set(lv_switch.closed_channels) - set(channels)
-        if open_channels:  # only open removed channels
-            logger.info("Open LV switch channels: %s", format_channels(open_channels))
-            lv_switch.open_channels(open_channels)
-
-        close_channels = set(channels) - set(lv_switch.closed_channels)
-        if close_channels:  # only close open channels
-            logger.info("Close LV switch channels: %s", format_channels(close_channels))
-            lv_switch.close_channels(close_channels)
-
-        if set(lv_switch.closed_channels) != set(channels):
-            raise RuntimeError("Failed to apply LV switch channels")
-
+        closed_channels = self._closed_channels.pop("lv_switch", None)
+        self._closed_channels["lv_switch"] = switch_apply_channels(lv_switch, channels, "LV", closed_channels)
 
     # Box
 
@@ -272,18 +350,16 @@ class Station:
                 if voltage:
                     logger.info("Ramping SMU to zero...")
                     voltage_ramp = LinearRange(voltage, 0, 25)
-                    for voltage in voltage_ramp:
+                    for voltage in paced(voltage_ramp, .5):
                         smu.voltage_level = voltage
-                        time.sleep(.5)
                     logger.info("Ramping SMU to zero... done.")
             elif function == smu.FUNCTION_CURRENT:
                 current = smu.current_level
                 if current:
                     logger.info("Ramping SMU to zero...")
                     current_ramp = LinearRange(current, 0, 2.5e-03)
-                    for current in current_ramp:
+                    for current in paced(current_ramp, .5):
                         smu.current_level = current
-                        time.sleep(.5)
                     logger.info("Ramping SMU to zero... done.")
             time.sleep(1.)
             smu.output = smu.OUTPUT_OFF
@@ -322,31 +398,31 @@ class Station:
         return smu.voltage_level
 
     def smu_set_voltage(self, level: float) -> None:
-        logger.info("Set SMU2 voltage: %s", format_metric(level, "V"))
+        logger.info("Set SMU2 voltage: %s", LazyMetric(level, "V"))
         smu = self.get_resource("smu")
         smu.voltage_level = level
 
     def smu_set_voltage_range(self, level: float) -> None:
         level_abs = abs(level)
-        logger.info("Set SMU2 voltage range: %s", format_metric(level_abs, "V"))
+        logger.info("Set SMU2 voltage range: %s", LazyMetric(level_abs, "V"))
         smu = self.get_resource("smu")
         smu.voltage_range = level_abs
 
     def smu_set_current_compliance(self, level: float) -> None:
-        logger.info("Set SMU2 current compliance: %s", format_metric(level, "A"))
+        logger.info("Set SMU2 current compliance: %s", LazyMetric(level, "A"))
         smu = self.get_resource("smu")
         smu.current_compliance = level
 
     def smu_read_current(self) -> float:
         smu = self.get_resource("smu")
         value = smu.measure_current()
-        logger.info("Read SMU2 current: %s", format_metric(value, "A"))
+        logger.info("Read SMU2 current: %s", LazyMetric(value, "A"))
         return value
 
     def smu_read_voltage(self) -> float:
         smu = self.get_resource("smu")
         value = smu.measure_voltage()
-        logger.info("Read SMU2 voltage: %s", format_metric(value, "V"))
+        logger.info("Read SMU2 voltage: %s", LazyMetric(value, "V"))
         return value
 
     def smu_compliance_tripped(self) -> bool:
@@ -355,13 +431,15 @@ class Station:
 
     def smu_recover_voltage(self, voltage_step: float = 10.0, waiting_time: float = 0.25) -> None:
         """Recover voltage level to zero without changing output state."""
-        output = self.smu_output()
+        smu = self.get_resource("smu")
+        output = smu.output
         if output:
-            voltage = self.smu_voltage()
+            voltage = smu.voltage_level
             if voltage:
                 voltage_range = LinearRange(voltage, 0, voltage_step)
                 for step, voltage in enumerate(voltage_range):
-                    self.smu_set_voltage(voltage)
+                    logger.info("Set SMU2 voltage: %s", LazyMetric(voltage, "V"))
+                    smu.voltage_level = voltage
                     time.sleep(waiting_time)
         else:
             self.smu_set_voltage(0)
@@ -372,27 +450,35 @@ class Station:
         """Ramp voltage to `voltage_end` in `voltage_step`s providing callbacks
         to be executed for every step before and after applying the next voltage
         step."""
-        voltage_begin = self.smu_voltage()
-        voltage_range = LinearRange(voltage_begin, voltage_end, voltage_step)
+        smu = self.get_resource("smu")
+        voltage_begin = smu.voltage_level
+        voltages = tuple(LinearRange(voltage_begin, voltage_end, voltage_step))
 
-        if abs(voltage_end) >= abs(voltage_begin):
+        # Resolve optional callbacks once
+        before_step = before_step if callable(before_step) else (lambda step, voltage: None)
+        after_step = after_step if callable(after_step) else (lambda step, voltage: None)
+
+        # Increase voltage range before, decrease voltage range after ramping
+        increase_range = abs(voltage_end) >= abs(voltage_begin)
+
+        if increase_range:
             self.smu_set_voltage_range(voltage_end)
 
         # Ramp to end voltage
-        for step, voltage in enumerate(voltage_range):
+        for step, voltage in enumerate(voltages):
 
             # Call custom callback
-            if callable(before_step):
-                before_step(step, voltage)
+            before_step(step, voltage)
 
-            self.smu_set_voltage(voltage)
+            logger.info("Set SMU2 voltage: %s", LazyMetric(voltage, "V"))
+            smu.voltage_level = voltage
             time.sleep(waiting_time)
 
             # Call custom callback
-            if callable(after_step):
-                after_step(step, voltage)
+            after_step(step, voltage)
 
-        self.smu_set_voltage_range(voltage_end)
+        if not increase_range:
+            self.smu_set_voltage_range(voltage_end)
 
     # Bias SMU
 
@@ -408,19 +494,17 @@ class Station:
                 if voltage:
                     logger.info("Ramping Bias SMU to zero...")
                     voltage_ramp = LinearRange(voltage, 0, 25)
-                    for voltage in voltage_ramp:
+                    for voltage in paced(voltage_ramp, .5):
                         smu.voltage_level = voltage
                         self.bias_voltage_changed(voltage)
-                        time.sleep(.5)
                     logger.info("Ramping Bias SMU to zero... done.")
             elif function == smu.FUNCTION_CURRENT:
                 current = smu.current_level
                 if current:
                     logger.info("Ramping Bias SMU to zero...")
                     current_ramp = LinearRange(current, 0, 25)
-                    for current in current_ramp:
+                    for current in paced(current_ramp, .5):
                         smu.current_level = current
-                        time.sleep(.5)
                     logger.info("Ramping Bias SMU to zero... done.")
             time.sleep(1.)
             smu.output = smu.OUTPUT_OFF
@@ -460,32 +544,32 @@ class Station:
         return bias_smu.voltage_level
 
     def bias_set_voltage(self, level: float) -> None:
-        logger.info("Set Bias voltage: %s", format_metric(level, "V"))
+        logger.info("Set Bias voltage: %s", LazyMetric(level, "V"))
         bias_smu = self.get_resource("bias_smu")
         bias_smu.voltage_level = level
         self.bias_voltage_changed(level)
 
     def bias_set_voltage_range(self, level: float) -> None:
         level_abs = abs(level)
-        logger.info("Set Bias voltage range: %s", format_metric(level_abs, "V"))
+        logger.info("Set Bias voltage range: %s", LazyMetric(level_abs, "V"))
         bias_smu = self.get_resource("bias_smu")
         bias_smu.voltage_range = level_abs
 
     def bias_set_current_compliance(self, level: float) -> None:
-        logger.info("Set Bias current compliance: %s", format_metric(level, "A"))
+        logger.info("Set Bias current compliance: %s", LazyMetric(level, "A"))
         bias_smu = self.get_resource("bias_smu")
         bias_smu.current_compliance = level
 
     def bias_read_current(self) -> float:
         bias_smu = self.get_resource("bias_smu")
         value = bias_smu.measure_current()
-        logger.info("Read Bias current: %s", format_metric(value, "A"))
+        logger.info("Read Bias current: %s", LazyMetric(value, "A"))
         return value
 
     def bias_read_voltage(self) -> float:
         bias_smu = self.get_resource("bias_smu")
         value = bias_smu.measure_voltage()
-        logger.info("Read Bias voltage: %s", format_metric(value, "V"))
+        logger.info("Read Bias voltage: %s", LazyMetric(value, "V"))
         return value
 
     def bias_compliance_tripped(self) -> None:
@@ -494,13 +578,16 @@ class Station:
 
     def bias_recover_voltage(self, voltage_step: float = 10.0, waiting_time: float = 0.25) -> None:
         """Recover voltage level to zero without changing output state."""
-        output = self.bias_output()
+        bias_smu = self.get_resource("bias_smu")
+        output = bias_smu.output
         if output:
-            voltage = self.bias_voltage()
+            voltage = bias_smu.voltage_level
             if voltage:
                 voltage_range = LinearRange(voltage, 0, voltage_step)
                 for step, voltage in enumerate(voltage_range):
-                    self.bias_set_voltage(voltage)
+                    logger.info("Set Bias voltage: %s", LazyMetric(voltage, "V"))
+                    bias_smu.voltage_level = voltage
+                    self.bias_voltage_changed(voltage)
                     time.sleep(waiting_time)
         else:
             self.bias_set_voltage(0)
@@ -511,27 +598,36 @@ class Station:
         """Ramp voltage to `voltage_end` in `voltage_step`s providing callbacks
         to be executed for every step before and after applying the next voltage
         step."""
-        voltage_begin = self.bias_voltage()
-        voltage_range = LinearRange(voltage_begin, voltage_end, voltage_step)
+        bias_smu = self.get_resource("bias_smu")
+        voltage_begin = bias_smu.voltage_level
+        voltages = tuple(LinearRange(voltage_begin, voltage_end, voltage_step))
 
-        if abs(voltage_end) >= abs(voltage_begin):
+        # Resolve optional callbacks once
+        before_step = before_step if callable(before_step) else (lambda step, voltage: None)
+        after_step = after_step if callable(after_step) else (lambda step, voltage: None)
+
+        # Increase voltage range before, decrease voltage range after ramping
+        increase_range = abs(voltage_end) >= abs(voltage_begin)
+
+        if increase_range:
             self.bias_set_voltage_range(voltage_end)
 
         # Ramp to end voltage
-        for step, voltage in enumerate(voltage_range):
+        for step, voltage in enumerate(voltages):
 
             # Call custom callback
-            if callable(before_step):
-                before_step(step, voltage)
+            before_step(step, voltage)
 
-            self.bias_set_voltage(voltage)
+            logger.info("Set Bias voltage: %s", LazyMetric(voltage, "V"))
+            bias_smu.voltage_level = voltage
+            self.bias_voltage_changed(voltage)
             time.sleep(waiting_time)
 
             # Call custom callback
-            if callable(after_step):
-                after_step(step, voltage)
+            after_step(step, voltage)
 
-        self.bias_set_voltage_range(voltage_end)
+        if not increase_range:
+            self.bias_set_voltage_range(voltage_end)
 
     # LCR
 
@@ -549,22 +645,25 @@ class Station:
         logger.info("Set LCR Meter correction length: 4 m")
         lcr.correction_length = 4
         # TODO add to generic LCR driver!
-        lcr.write(":INIT:CONT OFF")
-        lcr.write(":TRIG:SOUR BUS")
-        lcr.write(":CORR:OPEN:STAT OFF")
-        lcr.write(":CORR:SHORT:STAT OFF")
-        lcr.write(":CORR:LOAD:STAT OFF")
+        # Send configuration as single compound command
+        lcr.write(";".join([
+            ":INIT:CONT OFF",
+            ":TRIG:SOUR BUS",
+            ":CORR:OPEN:STAT OFF",
+            ":CORR:SHORT:STAT OFF",
+            ":CORR:LOAD:STAT OFF",
+        ]))
         for error in iter_errors(lcr):
             raise RuntimeError(f"LCR Error: {error.code}, {error.message}")
         logger.info("Safe initialize LCR Meter... done.")
 
     def lcr_set_amplitude(self, level: float) -> None:
-        logger.info("Set LCR Meter amplitude: %s", format_metric(level, "V"))
+        logger.info("Set LCR Meter amplitude: %s", LazyMetric(level, "V"))
         lcr = self.get_resource("lcr")
         lcr.amplitude = level
 
     def lcr_set_frequency(self, frequency: float) -> None:
-        logger.info("Set LCR Meter frequency: %s", format_metric(frequency, "Hz"))
+        logger.info("Set LCR Meter frequency: %s", LazyMetric(frequency, "Hz"))
         lcr = self.get_resource("lcr")
         lcr.frequency = frequency
 
@@ -577,18 +676,14 @@ class Station:
         logger.info("Perform LCR Meter open correction...")
         lcr = self.get_resource("lcr")
         lcr.resource.write(":CORR:OPEN")
-        t = Timer()
-        while t.delta() < timeout:
-            try:
+        # Instrument responds to *OPC? as soon as correction has completed
+        try:
+            with lcr.resource.temporary_timeout(timeout):
                 lcr.resource.query("*OPC?")
-            except Exception:
-                ...
-            else:
-                logger.info("Perform LCR Meter open correction... done.")
-                return
-            time.sleep(.5)
-        logger.error("Perform LCR Meter open correction... failed.")
-        raise RuntimeError("LCR Meter open correction failed.")
+        except Exception as exc:
+            logger.error("Perform LCR Meter open correction... failed.")
+            raise RuntimeError("LCR Meter open correction failed.") from exc
+        logger.info("Perform LCR Meter open correction... done.")
 
         #lcr.write(":CORR:OPEN:STAT ON")
         #lcr.query("*OPC?")
@@ -599,7 +694,7 @@ class Station:
         lcr.write("TRIG:IMM")
         # prim, sec = list(map(float, lcr.query("FETC?").split(",")))[:2]
         prim, sec = lcr.measure_impedance()
-        logger.info("LCR Meter reading: %s, %s", format_metric(prim, "F"), format_metric(sec, "Ohm"))
+        logger.info("LCR Meter reading: %s, %s", LazyMetric(prim, "F"), LazyMetric(sec, "Ohm"))
         return prim, sec
 
     def lcr_acquire_filter_reading(self, *, maximum: int = 64, threshold: float = 0.005,
@@ -607,12 +702,11 @@ class Station:
         """Aquire readings until standard deviation (sample) / mean < threshold.
         Size is the number of samples to be used for filter calculation.
         """
-        samples = []
+        samples: deque = deque(maxlen=size)
         prim, sec = 0., 0.
         for _ in range(maximum):
             prim, sec = self.lcr_acquire_reading()
             samples.append(prim)
-            samples = samples[-size:]
             if len(samples) >= size:
                 if std_mean_filter(samples, threshold):
                     return prim, sec
@@ -631,16 +725,19 @@ class Station:
         logger.info("Configure Electrometer...")
 
         # TODO
-        elm.write(":SENS:CURR:RANG:AUTO ON")
-        elm.write(":SENS:CURR:NPLC 10")
-        elm.write(":SENS:CURR:RANG:AUTO:LLIM 2E-9")
-        elm.write(":SENS:CURR:RANG:AUTO:ULIM 200E-6")
-        elm.write(":SENS:CURR:RANG 2E-9")
-        elm.write(":SENS:FUNC 'CURR'")
-        elm.write(":SYST:ZCH ON")
-        elm.write(":SYST:ZCOR ON")
-        elm.write(":FORM:ELEM READ")
-        elm.write(":SENS:CURR:RANG:AUTO ON")
+        # Send configuration as single compound command
+        elm.write(";".join([
+            ":SENS:CURR:RANG:AUTO ON",
+            ":SENS:CURR:NPLC 10",
+            ":SENS:CURR:RANG:AUTO:LLIM 2E-9",
+            ":SENS:CURR:RANG:AUTO:ULIM 200E-6",
+            ":SENS:CURR:RANG 2E-9",
+            ":SENS:FUNC 'CURR'",
+            ":SYST:ZCH ON",
+            ":SYST:ZCOR ON",
+            ":FORM:ELEM READ",
+            ":SENS:CURR:RANG:AUTO ON",
+        ]))
         elm.query("*OPC?")
 
         for error in iter_errors(elm):
@@ -656,23 +753,32 @@ class Station:
     def elm_read_current(self) -> float:
         elm = self.get_resource("elm")
         value = float(elm.query(":READ?"))
-        logger.info("Read Electrometer current: %s", format_metric(value, "A"))
+        logger.info("Read Electrometer current: %s", LazyMetric(value, "A"))
         return value
 
     # Table
 
+    def _get_table(self) -> Table:
+        """Return table controller for current table resource."""
+        driver = self.get_resource("table")
+        table = self._table
+        if table is None or table.driver is not driver:
+            table = Table(driver)
+            self._table = table
+        return table
+
     def table_configure(self) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         table.configure()
 
     def table_abort(self) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         table.abort()
 
     def table_apply_profile(self, name: str) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
 
-        profile = Settings().tableProfile(name)
+        profile = self._settings.tableProfile(name)
         if not profile:
             raise KeyError("No such table profile: %r", name)
 
@@ -689,19 +795,19 @@ class Station:
             logger.info("Set table velocity: %G", vel)
 
     def table_position(self) -> Tuple[float, float, float]:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         return table.position()
 
     def table_move_relative(self, position: Tuple[float, float, float]) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         table.move_relative(position)
 
     def table_move_absolute(self, position: Tuple[float, float, float]) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         table.move_absolute(position)
 
     def table_safe_move_absolute(self, position: Tuple[float, float, float]) -> None:
-        table = Table(self.get_resource("table"))
+        table = self._get_table()
         table.safe_move_absolute(position)
 
 
@@ -710,6 +816,7 @@ class Station:
     needles_axis: int = 0
     needles_up_position: float = 1000.
     needles_down_position: float = 0.
+    needles_poll_interval: float = 0.100
 
     def needles_verify_position(self, position: float, decimals: int = 3) -> None:
         tango = self.get_resource("tango")
@@ -743,7 +850,7 @@ class Station:
         def condition():
             return not tango.is_moving
         try:
-            wait_until(condition)
+            wait_until(condition, interval=type(self).needles_poll_interval)
         except TimeoutError as exc:
             raise TimeoutError("Needle movement timeout.") from exc
 
@@ -776,15 +883,14 @@ class CapacitorDischarge:
         self.timeout: float = 10.0  # Seconds
         self.settle_time: float = 1.0
 
-    def check_discharged_state(self) -> bool:
-        samples = []
-        smu = self.station.get_resource("smu")
-        for _ in range(self.sample_count):
-            voltage = smu.measure_voltage()
-            samples.append(voltage)
-            time.sleep(self.sample_interval)
+    def check_discharged_state(self, smu) -> bool:
+        total_voltage = 0.
+        for index in range(self.sample_count):
+            if index:
+                time.sleep(self.sample_interval)
+            total_voltage += smu.measure_voltage()
 
-        mean_voltage = statistics.mean(samples)
+        mean_voltage = total_voltage / self.sample_count
 
         return mean_voltage <= self.threshold_voltage
 
@@ -800,18 +906,21 @@ class CapacitorDischarge:
         time.sleep(self.settle_time)
 
         success = False
-        t = Timer()
+        deadline = time.monotonic() + self.timeout
 
         while True:
-            success = self.check_discharged_state()
+            success = self.check_discharged_state(smu)
 
             if success:
                 break
 
-            if t.delta() > self.timeout:
+            if time.monotonic() > deadline:
                 logger.error("Capacitor discarge timeout (%.1f s).", self.timeout)
                 break
 
+            # Keep samples of consecutive checks evenly spaced
+            time.sleep(self.sample_interval)
+
         smu.output = smu.OUTPUT_OFF
         smu.function = smu.FUNCTION_VOLTAGE
         smu.route_terminal = smu.ROUTE_TERMINAL_REAR
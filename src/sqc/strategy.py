@@ -7,7 +7,7 @@ from comet.parameter import validate_parameters
 from comet.estimate import Estimate
 
 from .core.geometry import NeedlesGeometry
-from .core.transformation import affine_transformation, transform
+from .core.transformation import affine_transformation, make_transformer
 from .core.measurement import measurement_registry
 from .core.utils import parse_strips, verify_position
 from .measurements import ComplianceError, AnalysisError
@@ -167,8 +167,9 @@ class ContactHandler:
         T, V0 = affine_transformation(s1, s2, s3, t1, t2, t3)
         logger.info("Transformation matrix: T=%s V0=%s", T, V0)
         self.contact_positions = {}
+        transform = make_transformer(T, V0)
         for pad in padfile.pads.values():
-            position = transform(T, V0, pad.position)
+            position = transform(pad.position)
             self.contact_positions[pad.name] = (pad, position)
         logger.info("Transformed %d positions.", len(self.contact_positions))
 
@@ -0,0 +1,33 @@
+import threading
+
+from sqc.core.camera import FrameQueue
+
+
+def test_frame_queue():
+    frames = FrameQueue(maxsize=4)
+    assert [frames.put(frame) for frame in range(6)] == [False, False, False, False, True, True]
+    iterator = iter(frames)
+    assert [next(iterator) for _ in range(4)] == [2, 3, 4, 5]
+    frames.close()
+    assert list(iterator) == []
+
+
+def test_frame_queue_close_full():
+    frames = FrameQueue(maxsize=2)
+    frames.put(1)
+    frames.put(2)
+    frames.close()  # drops oldest frame to stop consumer
+    assert list(frames) == [2]
+
+
+def test_frame_queue_consumer_thread():
+    frames = FrameQueue(maxsize=4)
+    received = []
+    consumer = threading.Thread(target=lambda: received.extend(frames))
+    consumer.start()
+    frames.put(1)
+    frames.put(2)
+    frames.close()
+    consumer.join(timeout=1.0)
+    assert not consumer.is_alive()
+    assert received == [1, 2]
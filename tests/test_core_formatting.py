@@ -9,6 +9,12 @@ def test_format_metric():
     assert formatting.format_metric(4.2e-11, "A", 1) == "42.0 pA"
 
 
+def test_lazy_metric():
+    assert str(formatting.LazyMetric(42, "V")) == "42.000 V"
+    assert str(formatting.LazyMetric(4.2e-11, "A", 1)) == "42.0 pA"
+    assert "{}".format(formatting.LazyMetric(None, "V")) == "---"
+
+
 def test_format_switch():
     assert formatting.format_switch(False) == "OFF"
     assert formatting.format_switch(True) == "ON"
@@ -21,6 +21,14 @@ def test_pad():
     assert p.distance(p) == 0
 
 
+def test_pad_hash():
+    p = Pad("P", 1, 2, 3)
+    assert hash(p) == hash(Pad("P", 1, 2, 3))
+    assert len({p, Pad("P", 1, 2, 3), Pad("A", 1, 2, 3)}) == 2
+    with pytest.raises(AttributeError):
+        p.w = 4
+
+
 def test_pad_distance():
     p = Pad("P", 1, 2, 3)
     q = Pad("Q", 4, -5, 6)
@@ -45,6 +53,18 @@ def test_pads():
     assert pp.references == []
 
 
+def test_pads_set_reference():
+    pp = Padfile()
+    pp.add_pad("A", 1, 2, 3)
+    pp.add_pad("B", 1, 4, 3)
+    pp.set_reference("B")
+    pp.set_reference("A")
+    pp.set_reference("B")
+    assert pp.references == [Pad("B", 1, 4, 3), Pad("A", 1, 2, 3)]
+    with pytest.raises(KeyError):
+        pp.set_reference("C")
+
+
 def test_pads_index():
     pp = Padfile()
     pp.add_pad("A1", 1, 2, 3)
@@ -73,6 +93,41 @@ def test_pads_slice():
         pp.slice("A1", "P2")
 
 
+def test_pads_distances_from():
+    pp = Padfile()
+    pp.add_pad("P1", 1, 2, 3)
+    pp.add_pad("P2", 4, -5, 6)
+    assert pp.coordinates().tolist() == [[1, 4], [2, -5], [3, 6]]
+    assert pp.distances_from("P1").tolist() == [0, pytest.approx(8.18535277187245)]
+    pp.add_pad("P3", 1, 2, 4)
+    assert pp.distances_from("P3").tolist() == [1, pytest.approx(7.874007874011811), 0]
+    with pytest.raises(KeyError):
+        pp.distances_from("P4")
+    assert Padfile().coordinates().shape == (3, 0)
+
+
+def test_pads_coordinates_read_only():
+    pp = Padfile()
+    pp.add_pad("P1", 1, 2, 3)
+    with pytest.raises(ValueError):
+        pp.coordinates()[0, 0] = 4
+    assert pp.coordinates().tolist() == [[1], [2], [3]]
+
+
+def test_pads_nearest():
+    pp = Padfile()
+    assert pp.nearest((0, 0, 0)) is None
+    assert pp.find_pad((0, 0, 0)) is None
+    pp.add_pad("P1", 1, 2, 3)
+    pp.add_pad("P2", 4, -5, 6)
+    pp.add_pad("P3", 4, -5, 6)
+    assert pp.nearest((0, 0, 0)) == Pad("P1", 1, 2, 3)
+    assert pp.nearest((4, -4, 6)) == Pad("P2", 4, -5, 6)
+    assert pp.find_pad((1, 2, 3)) == Pad("P1", 1, 2, 3)
+    assert pp.find_pad((4, -5, 6)) == Pad("P2", 4, -5, 6)
+    assert pp.find_pad((1, 2, 4)) is None
+
+
 def test_read_property():
     assert read_property("") is None
     assert read_property(":") is None
@@ -114,6 +169,18 @@ def test_load():
     assert pp.references == [ref_pads.get("A"), ref_pads.get("C")]
 
 
+def test_load_invalid():
+    data = io.StringIO(os.linesep.join([
+        "# comment",
+        "strip\tx\ty\tz",
+        "A\t1\t0\t-1",
+    ]))
+    assert geometry.load(data).pads == {"A": Pad("A", 1, 0, -1)}
+    for line in [":", "A\t1\t0", "A\t1\tx\t0"]:
+        with pytest.raises(ValueError):
+            geometry.load(io.StringIO(line))
+
+
 def test_dump():
     pp = geometry.Padfile()
     pp.set_property("name", "test")
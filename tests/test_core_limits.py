@@ -22,3 +22,12 @@ def test_limits_aggregator():
     limits.add([(2, 3)])
     assert limits.limits == (-2, 3, 3, 9)
     assert limits.is_valid is True
+
+
+def test_limits_aggregator_series():
+    limits = LimitsAggregator()
+    limits.add([])
+    assert limits.is_valid is False
+    limits.add((x, x * 2) for x in range(-2, 5))
+    assert limits.limits == (-2, -4, 4, 8)
+    assert limits.is_valid is True
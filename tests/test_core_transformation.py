@@ -1,6 +1,8 @@
 from functools import partial
 
-from sqc.core.transformation import affine_transformation, transform
+import pytest
+
+from sqc.core.transformation import affine_transformation, make_transformer, transform
 
 
 def round_values(values, precision=9):
@@ -37,3 +39,16 @@ def test_transform_z():
     assert tr((0, 100, 0)) == (0, 100, 10)
     assert tr((0, 50, 0)) == (0, 50, 5)
     assert round_values(tr((50, 100, 0))) == round_values((50, 100, 5))
+
+
+def test_make_transformer():
+    T, V0 = affine_transformation(
+        (0, 0, 0), (0, 100, 0), (100, 100, 0),
+        (1, 1, 1), (1, 111, 10), (101, 101, 20)
+    )
+    tr = make_transformer(T, V0)
+    assert round_values(tr((0, 0, 0))) == [1.0, 1.0, 1.0]
+    assert round_values(tr((0, 50, 0))) == [1.0, 56.0, 5.5]
+    assert round_values(tr((100, 0, 0))) == [101.0, -9.0, 11.0]
+    with pytest.raises(ValueError):
+        make_transformer(-1, -1)
@@ -3,6 +3,7 @@ import pytest
 from sqc.core.utils import (
     tokenize,
     cv_inverse_square,
+    cv_inverse_square_batch,
     extract_slice,
     create_slices,
     normalize_strip_expression,
@@ -27,6 +28,15 @@ def test_cv_inverse_square():
     assert cv_inverse_square(3, 4) == (3., .0625)
 
 
+def test_cv_inverse_square_batch():
+    x, y = cv_inverse_square_batch([0, 1, 2, 3], [0, 1, 2, 4])
+    assert x.tolist() == [0., 1., 2., 3.]
+    assert y.tolist() == [0., 1., .25, .0625]
+    x, y = cv_inverse_square_batch([], [])
+    assert x.tolist() == []
+    assert y.tolist() == []
+
+
 def test_extract_slice():
     names = ["P1", "P2", "P3", "P4", "P5", "P6", "P7"]
     assert extract_slice(names, "P1", "P1") == ["P1"]
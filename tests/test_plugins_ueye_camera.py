@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+
+ueye = pytest.importorskip("pyueye.ueye", exc_type=ImportError)  # requires IDS uEye SDK
+
+from sqc.plugins.ueye_camera.camera import CaptureStatistics, SensorInfo, get_bits_per_pixel, get_channels  # noqa: E402
+
+
+def test_get_channels():
+    assert get_channels(get_bits_per_pixel(ueye.IS_CM_MONO8)) == 1
+    assert get_channels(get_bits_per_pixel(ueye.IS_CM_SENSOR_RAW10)) == 2
+    assert get_channels(get_bits_per_pixel(ueye.IS_CM_BGR8_PACKED)) == 3
+    assert get_channels(get_bits_per_pixel(ueye.IS_CM_BGRA8_PACKED)) == 4
+
+
+def test_sensor_info():
+    info = ueye.SENSORINFO()
+    info.SensorID = 42
+    info.strSensorName = b"UI306xCP-C"
+    info.nColorMode = b"\x02"
+    info.nMaxWidth = 1936
+    info.nMaxHeight = 1216
+    info.bGlobShutter = 1
+    info.wPixelSize = 586
+    info.nUpperLeftBayerPixel = b"\x01"
+    sensor_info = SensorInfo(info)
+    assert sensor_info.nColorMode == 2
+    assert sensor_info.nUpperLeftBayerPixel == 1
+    assert sensor_info.SensorID == 42
+    assert sensor_info.strSensorName == "UI306xCP-C"
+    assert sensor_info.nMaxWidth == 1936
+    assert sensor_info.nMaxHeight == 1216
+    assert sensor_info.bGlobShutter == 1
+    assert sensor_info.wPixelSize == 586
+
+
+def test_capture_statistics_report(caplog):
+    caplog.set_level(logging.DEBUG)
+    stats = CaptureStatistics()
+    stats.add_wait(ueye.IS_SUCCESS, .040)
+    stats.report()
+    stats.add_wait(ueye.IS_SUCCESS, .040)
+    stats.add_wait(ueye.IS_TIMED_OUT, 1.0)
+    stats.report()
+    stats.frames_dropped += 1
+    stats.report()
+    assert [record.levelno for record in caplog.records] == [logging.DEBUG, logging.WARNING, logging.WARNING]
+    assert stats.frames_ok == 0
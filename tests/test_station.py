@@ -1,6 +1,11 @@
 import random
+import threading
+import time
 
-from sqc.station import Event
+import pytest
+
+from sqc import station as station_module
+from sqc.station import Event, Station, as_channel_set, paced, switch_apply_channels
 
 
 class FakeStation:
@@ -44,3 +49,126 @@ class FakeStation:
 
     def box_environment(self):
         return {}
+
+
+class FakeSwitch:
+
+    def __init__(self):
+        self._closed_channels = set()
+        self.queries = 0
+
+    @property
+    def closed_channels(self):
+        self.queries += 1
+        return list(self._closed_channels)
+
+    def open_channels(self, channels):
+        self._closed_channels -= set(channels)
+
+    def close_channels(self, channels):
+        self._closed_channels |= set(channels)
+
+
+def test_as_channel_set():
+    channels = frozenset(["A1", "B1"])
+    assert as_channel_set(channels) is channels
+    assert as_channel_set(["A1", "B1", "A1"]) == channels
+    assert as_channel_set(iter(["A1", "B1"])) == channels
+    assert as_channel_set([]) == frozenset()
+
+
+def test_switch_apply_channels():
+    switch = FakeSwitch()
+    switch_apply_channels(switch, ["A1", "B1"], "HV")
+    assert set(switch.closed_channels) == {"A1", "B1"}
+    switch = FakeSwitch()
+    closed_channels = switch_apply_channels(switch, ["A1", "B1"], "HV")
+    assert closed_channels == {"A1", "B1"}
+    assert switch.queries == 2
+    closed_channels = switch_apply_channels(switch, ["B1", "C2"], "HV", closed_channels)
+    assert closed_channels == {"B1", "C2"}
+    assert switch.queries == 3
+    switch.close_channels = lambda channels: None
+    with pytest.raises(RuntimeError):
+        switch_apply_channels(switch, ["A1"], "HV")
+
+
+def test_paced():
+    assert list(paced([], .001)) == []
+    assert list(paced([1, 2, 3], .001)) == [1, 2, 3]
+    # Time spent by the consumer counts towards the interval
+    t = time.monotonic()
+    for _ in paced(range(4), .050):
+        time.sleep(.030)
+    elapsed = time.monotonic() - t
+    assert 4 * .050 <= elapsed < 4 * .050 + .060
+
+
+class FakeEnvironController:
+
+    def start(self):
+        ...
+
+
+class FakeResource:
+
+    model = "fake"
+    address = "fake"
+
+    def __init__(self, opened):
+        self.opened = opened
+
+    def __enter__(self):
+        time.sleep(.050)
+        self.opened.append(self)
+        return self
+
+    def __exit__(self, *args):
+        ...
+
+
+class FakeDriver:
+
+    def __init__(self, resource):
+        self.resource = resource
+
+
+def test_station_open_resource_concurrent(monkeypatch):
+    monkeypatch.setattr(station_module, "EnvironController", FakeEnvironController)
+    monkeypatch.setattr(station_module, "create_driver", lambda model: FakeDriver)
+    station = Station()
+    opened = []
+    monkeypatch.setattr(station._settings, "createResource", lambda name: FakeResource(opened))
+    threads = [threading.Thread(target=station.open_resource, args=("table",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(opened) == 1
+    assert station.get_resource("table").resource is opened[0]
+    station.close_resources()
+    assert station._resources == {}
+
+
+class FakeFailingResource(FakeResource):
+
+    def __enter__(self):
+        raise OSError("no device")
+
+
+def test_station_open_resources_failed(monkeypatch):
+    monkeypatch.setattr(station_module, "EnvironController", FakeEnvironController)
+    monkeypatch.setattr(station_module, "create_driver", lambda model: FakeDriver)
+    station = Station()
+    opened = []
+
+    def create_resource(name):
+        if name == "lcr":
+            return FakeFailingResource(opened)
+        return FakeResource(opened)
+
+    monkeypatch.setattr(station._settings, "createResource", create_resource)
+    with pytest.raises(OSError):
+        station.open_resources()
+    assert len(opened) == len(station.registered_resources) - 1
+    assert station._resources == {}